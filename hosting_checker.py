@@ -1,14 +1,21 @@
 import re
 import os
-import requests
+import asyncio
+import functools
+from operator import itemgetter
+import ssl
+import httpx
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+import ahocorasick
 import pandas as pd
+import xlsxwriter
+import dns.asyncresolver
+import dns.exception
 import dns.resolver
+import tldextract
 from tqdm import tqdm
-import time
-import urllib3
-from bs4 import BeautifulSoup
-
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+from selectolax.lexbor import LexborHTMLParser
 
 hosting_providers = {
     "BigCommerce": "bigcommerce",
@@ -26,6 +33,28 @@ hosting_providers = {
     "WordPress.com": "wp.com"
 }
 
+# (keyword, provider) pairs, lowercased once, in hosting_providers order
+FLAT_KEYWORDS = tuple(
+    (keyword.lower(), provider)
+    for provider, keywords in hosting_providers.items()
+    for keyword in (keywords if isinstance(keywords, list) else [keywords])
+)
+
+def build_provider_automaton(flat_keywords):
+    # Values carry the keyword's position so the earliest listed provider
+    # still wins when several keywords match
+    automaton = ahocorasick.Automaton()
+    for priority, (keyword, provider) in enumerate(flat_keywords):
+        if not automaton.exists(keyword):
+            automaton.add_word(keyword, (priority, provider))
+    automaton.make_automaton()
+    return automaton
+
+PROVIDER_AUTOMATON = build_provider_automaton(FLAT_KEYWORDS)
+
+# Attribute read from each kind of <head> tag when a page has to be parsed
+HEAD_ATTRIBUTES = {"meta": "content", "script": "src", "link": "href"}
+
 name_server_providers = {
     "A2 Hosting": ["a2hosting.com"],
     "AWS": ["awsdns"],
@@ -48,6 +77,30 @@ HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/110.0.0.0 Safari/537.36"
 }
 
+TIMEOUT = httpx.Timeout(10.0, connect=3.0)
+LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+MAX_RETRIES = 2
+RETRY_BACKOFF = 0.3
+
+# Certificates are not checked, so one context can be shared by every run
+SSL_CONTEXT = ssl.create_default_context()
+SSL_CONTEXT.check_hostname = False
+SSL_CONTEXT.verify_mode = ssl.CERT_NONE
+
+CHUNK_SIZE = 8192
+MAX_HEAD_BYTES = 65536
+
+RESOLVER = dns.asyncresolver.Resolver()
+RESOLVER.nameservers = ["1.1.1.1", "1.0.0.1", "8.8.8.8"]
+RESOLVER.timeout = 2
+RESOLVER.lifetime = 4
+RESOLVER.cache = dns.resolver.LRUCache(4096)
+
+# Use the bundled public suffix list rather than fetching it on first use
+TLD_EXTRACT = tldextract.TLDExtract(suffix_list_urls=())
+
+MARKDOWN_LINK_RE = re.compile(r"\[([^\]\n]+)\]\((https?://[^\s\)]+)\)")
+
 def get_user_input_method():
     print("Choose input method:")
     print("1. Load from .md file")
@@ -60,14 +113,17 @@ def get_user_input_method():
 
 def extract_links_with_context(filename):
     links_with_context = []
-    markdown_link_pattern = r"\[([^\]]+)\]\((https?://[^\s\)]+)\)"
     with open(filename, 'r', encoding='utf-8') as file:
-        for line in file:
-            matches = re.findall(markdown_link_pattern, line)
-            if matches:
-                source_name, source_url = matches[0]
-                for anchor_text, link in matches[1:]:
-                    links_with_context.append((source_name, source_url, link))
+        text = file.read()
+    current_line = None
+    for match in MARKDOWN_LINK_RE.finditer(text):
+        line_start = text.rfind("\n", 0, match.start())
+        if line_start != current_line:
+            # The first link on a line is the source for the rest of that line
+            current_line = line_start
+            source_name, source_url = match.groups()
+        else:
+            links_with_context.append((source_name, source_url, match.group(2)))
     return links_with_context
 
 def normalize_url(url):
@@ -75,6 +131,11 @@ def normalize_url(url):
         return "https://" + url
     return url
 
+def normalize_urls(urls):
+    urls = urls.dropna().astype(str)
+    has_scheme = urls.str.startswith(("http://", "https://"))
+    return urls.where(has_scheme, "https://" + urls).tolist()
+
 def get_manual_links():
     print("\nEnter URLs to check (one per line). Type 'done' when finished:")
     manual_links = []
@@ -99,46 +160,56 @@ def get_links_from_csv():
         if column_name not in df.columns:
             print(f"❌ Column '{column_name}' not found in CSV.")
             return []
-        return [("CSV Entry", "N/A", normalize_url(url)) for url in df[column_name].dropna() if isinstance(url, str)]
+        return [("CSV Entry", "N/A", url) for url in normalize_urls(df[column_name])]
     except FileNotFoundError:
         print("❌ File not found.")
     except Exception as e:
         print(f"❌ Error reading CSV: {e}")
     return []
 
-def identify_host(html):
-    soup = BeautifulSoup(html, "html.parser")
-    head_tag = soup.head
-    if not head_tag:
+def match_hosting_provider(text):
+    # itemgetter keeps the min() over every hit in C, with no Python frame per match
+    best = min(PROVIDER_AUTOMATON.iter(text), key=itemgetter(1), default=None)
+    return best[1][1] if best else None
+
+def identify_host_from_tree(body, encoding):
+    try:
+        html = body.decode(encoding, errors="replace")
+    except LookupError:
+        html = body.decode("utf-8", errors="replace")
+    head = LexborHTMLParser(html).css_first("head")
+    if head is None:
         return "Other"
-    head_text = " ".join(head_tag.stripped_strings).lower()
-    meta_content = " ".join([meta.get("content", "").lower() for meta in head_tag.find_all("meta")])
-    script_srcs = " ".join([script.get("src", "").lower() for script in head_tag.find_all("script") if script.get("src")])
-    link_hrefs = " ".join([link.get("href", "").lower() for link in head_tag.find_all("link") if link.get("href")])
-    title_content = head_tag.title.string.lower() if head_tag.title else ""
-    combined_text = f"{head_text} {meta_content} {script_srcs} {link_hrefs} {title_content}"
-    for provider, keywords in hosting_providers.items():
-        if isinstance(keywords, list):
-            if any(keyword in combined_text for keyword in keywords):
-                return provider
-        elif keywords in combined_text:
-            return provider
-    return "Other"
+    parts = [head.text(deep=True, separator=" ")]
+    for node in head.css("meta[content], script[src], link[href]"):
+        parts.append(node.attributes.get(HEAD_ATTRIBUTES[node.tag]) or "")
+    combined_text = " ".join(parts).lower()
+    return match_hosting_provider(combined_text) or "Other"
+
+def identify_host(body, encoding="utf-8"):
+    # Scan the raw <head> markup first; only build a DOM when that finds nothing.
+    # Keywords are ASCII, so a latin-1 view of the bytes matches them in any
+    # ASCII-compatible encoding without decoding the page for real.
+    lowered = body.lower().decode("latin-1")
+    end = lowered.find("</head>")
+    head_blob = lowered[:end if end > 0 else 4096]
+    provider = match_hosting_provider(head_blob)
+    if provider:
+        return provider
+    if "<head" not in lowered[:8192]:
+        return "Other"
+    # Only the head fragment goes to the parser, never the body after it
+    return identify_host_from_tree(body[:end + len("</head>")] if end > 0 else body, encoding)
 
-def get_name_server_provider(domain):
+@functools.lru_cache(maxsize=None)
+def registrable_domain(domain):
+    return TLD_EXTRACT(domain).top_domain_under_public_suffix or domain
+
+async def get_name_server_provider(domain):
     try:
-        answers = dns.resolver.resolve(domain, 'NS')
-    except (dns.resolver.NoAnswer, dns.resolver.NXDOMAIN, dns.resolver.NoNameservers):
-        # Try base domain if initial lookup fails
-        parts = domain.split('.')
-        if len(parts) > 2:
-            base_domain = '.'.join(parts[-2:])
-            try:
-                answers = dns.resolver.resolve(base_domain, 'NS')
-            except Exception:
-                return "DNS Lookup Failed"
-        else:
-            return "DNS Lookup Failed"
+        answers = await RESOLVER.resolve(domain, 'NS')
+    except dns.exception.DNSException:
+        return "DNS Lookup Failed"
 
     ns_servers = [str(rdata).strip('.') for rdata in answers]
     for provider, keywords in name_server_providers.items():
@@ -146,44 +217,95 @@ def get_name_server_provider(domain):
             return provider
     return ", ".join(ns_servers)
 
+async def read_head(response):
+    # Only the <head> is inspected, so stop reading once it has been closed
+    head = bytearray()
+    async for chunk in response.aiter_bytes(CHUNK_SIZE):
+        head += chunk
+        if b"</head>" in head[-len(chunk) - 6:].lower() or len(head) >= MAX_HEAD_BYTES:
+            break
+    return bytes(head)
+
+async def fetch(client, link):
+    for attempt in range(MAX_RETRIES + 1):
+        try:
+            async with client.stream("GET", link) as response:
+                response.raise_for_status()
+                return link, await read_head(response), response.charset_encoding or "utf-8"
+        except httpx.ConnectError:
+            if attempt == MAX_RETRIES:
+                raise
+            await asyncio.sleep(RETRY_BACKOFF * 2 ** attempt)
+
+async def check_site(client, semaphore, progress, ns_lookups, source_name, source_url, link):
+    host = "Other"
+    ns_provider = "Unknown"
+    try:
+        hostname = urlsplit(link).hostname or ""
+        domain = registrable_domain(hostname[4:] if hostname.startswith("www.") else hostname)
+        async with semaphore:
+            # Start the NS lookup alongside this site's fetch, once per registrable
+            # domain, so the semaphore also caps how many queries go out at once
+            if domain not in ns_lookups:
+                ns_lookups[domain] = asyncio.ensure_future(get_name_server_provider(domain))
+            _, body, encoding = await fetch(client, link)
+        host = await asyncio.get_running_loop().run_in_executor(None, identify_host, body, encoding)
+        ns_provider = await ns_lookups[domain]
+    except httpx.TimeoutException:
+        host = "Timeout (Increase timeout)"
+        print(f"❌ Timeout: {link}")
+    except httpx.HTTPStatusError as e:
+        host = f"[ERROR] HTTP Error {e.response.status_code}"
+        print(f"❌ HTTP Error {e.response.status_code}: {link}")
+    except httpx.ConnectError:
+        host = "[ERROR] Connection Error"
+        print(f"❌ Connection Error: {link}")
+    except (httpx.HTTPError, httpx.InvalidURL, UnicodeError, ValueError):
+        host = "[ERROR] Request Failed"
+        print(f"❌ Request Failed: {link}")
+    finally:
+        progress.update(1)
+    return (source_name, source_url, link, host, ns_provider)
+
+async def run(links_with_context):
+    semaphore = asyncio.Semaphore(50)
+    ns_lookups = {}
+    # Parse pages on worker threads so a large document doesn't stall every open socket
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=32))
+    # HTTP/2 lets sites on the same CDN share one multiplexed TLS connection
+    client = httpx.AsyncClient(http2=True, verify=SSL_CONTEXT, limits=LIMITS, headers=HEADERS,
+                               timeout=TIMEOUT, follow_redirects=True)
+    with tqdm(total=len(links_with_context), desc="Progress", unit="site") as progress:
+        async with client:
+            return await asyncio.gather(*[
+                check_site(client, semaphore, progress, ns_lookups, source_name, source_url, link)
+                for source_name, source_url, link in links_with_context
+            ])
+
 def check_hosting(links_with_context):
-    results = []
     print("\nChecking website hosting & name servers...")
-    for source_name, source_url, link in tqdm(links_with_context, desc="Progress", unit="site"):
-        host = "Other"
-        ns_provider = "Unknown"
-        try:
-            response = requests.get(link, headers=HEADERS, timeout=10, verify=False)
-            response.raise_for_status()
-            host = identify_host(response.text)
-            domain = re.sub(r"https?://(www\\.)?", "", link).split("/")[0]
-            ns_provider = get_name_server_provider(domain)
-        except requests.exceptions.Timeout:
-            host = "Timeout (Increase timeout)"
-            print(f"❌ Timeout: {link}")
-        except requests.exceptions.SSLError:
-            host = "SSL Error (Invalid Cert)"
-            print(f"❌ SSL Error: {link}")
-        except requests.exceptions.HTTPError as e:
-            host = f"[ERROR] HTTP Error {response.status_code}"
-            print(f"❌ HTTP Error {response.status_code}: {link}")
-        except requests.exceptions.ConnectionError:
-            host = "[ERROR] Connection Error"
-            print(f"❌ Connection Error: {link}")
-        except requests.exceptions.RequestException:
-            host = "[ERROR] Request Failed"
-            print(f"❌ Request Failed: {link}")
-        results.append((source_name, source_url, link, host, ns_provider))
-        time.sleep(1)
-    return results
+    return asyncio.run(run(links_with_context))
 
 def save_to_excel(data, input_type, output_filename="host_checker_results.xlsx"):
     if input_type == "md":
-        df = pd.DataFrame(data, columns=["Name", "Profile", "URL", "Host", "NS Provider"])
+        columns = ["Name", "Profile", "URL", "Host", "NS Provider"]
+        rows = data
     else:
-        df = pd.DataFrame([(url, host, ns) for _, _, url, host, ns in data],
-                          columns=["URL", "Host", "NS Provider"])
-    df.to_excel(output_filename, index=False)
+        columns = ["URL", "Host", "NS Provider"]
+        rows = ((url, host, ns) for _, _, url, host, ns in data)
+    # constant_memory flushes each row once the next one starts, so rows are
+    # written in order here rather than through DataFrame.to_excel (column by column)
+    workbook = xlsxwriter.Workbook(output_filename, {
+        "constant_memory": True,
+        "strings_to_urls": False,
+        "strings_to_formulas": False,
+    })
+    worksheet = workbook.add_worksheet()
+    header_format = workbook.add_format({"bold": True, "border": 1, "align": "center", "valign": "top"})
+    worksheet.write_row(0, 0, columns, header_format)
+    for row_number, row in enumerate(rows, start=1):
+        worksheet.write_row(row_number, 0, row)
+    workbook.close()
     print(f"\nResults saved to {output_filename}")
 
 if __name__ == "__main__":
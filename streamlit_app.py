@@ -1,11 +1,36 @@
 import streamlit as st
 import pandas as pd
-from io import StringIO
-from hosting_checker import check_hosting, extract_links_with_context, normalize_url, save_to_excel
+from io import BytesIO
+from hosting_checker import check_hosting, extract_links_with_context, normalize_url, normalize_urls, save_to_excel
 import tempfile
 import os
 
 st.set_page_config(page_title="Website Hosting Checker", layout="centered")
+
+# --- Cached helpers: reruns with the same upload or URL list skip the work ---
+@st.cache_data
+def parse_markdown(data):
+    with tempfile.NamedTemporaryFile(delete=False, suffix=".md") as tmp:
+        tmp.write(data)
+        tmp_path = tmp.name
+    return extract_links_with_context(tmp_path)
+
+@st.cache_data
+def read_csv(data):
+    return pd.read_csv(BytesIO(data))
+
+@st.cache_data
+def parse_csv_links(data, url_column):
+    return [("CSV Entry", "N/A", url) for url in normalize_urls(read_csv(data)[url_column])]
+
+@st.cache_data(ttl=3600)
+def check_hosting_cached(links_with_context):
+    return check_hosting(links_with_context)
+
+def has_failed_rows(results):
+    return any(host.startswith(("Timeout", "[ERROR]")) or ns == "DNS Lookup Failed"
+               for _, _, _, host, ns in results)
+
 st.title("🛰️ Host Checker")
 
 # --- Input selection ---
@@ -21,20 +46,16 @@ input_mode = None
 if input_type == "Featured quotes file [.md]":
     uploaded_md = st.file_uploader("Upload a Markdown (.md) file", type=["md"])
     if uploaded_md:
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".md") as tmp:
-            tmp.write(uploaded_md.read())
-            tmp_path = tmp.name
-        links_with_context = extract_links_with_context(tmp_path)
+        links_with_context = parse_markdown(uploaded_md.getvalue())
         input_mode = "md"
 
 # --- Option 2: CSV Upload ---
 elif input_type == "List of URLs [.csv]":
     uploaded_csv = st.file_uploader("Upload a CSV file. The column containing the URLs must have a header called URL.", type=["csv"])
     if uploaded_csv:
-        df = pd.read_csv(uploaded_csv)
+        df = read_csv(uploaded_csv.getvalue())
         url_column = st.selectbox("Select the column containing URLs:", df.columns)
-        raw_urls = df[url_column].dropna().astype(str).tolist()
-        links_with_context = [("CSV Entry", "N/A", normalize_url(url)) for url in raw_urls]
+        links_with_context = parse_csv_links(uploaded_csv.getvalue(), url_column)
         input_mode = "csv"
 
 # --- Option 3: Manual Input ---
@@ -49,7 +70,10 @@ elif input_type == "Enter URLs manually":
 if links_with_context:
     if st.button("Check sites"):
         with st.spinner("Dialing up hosting signals... please hold."):
-            results = check_hosting(links_with_context)
+            results = check_hosting_cached(links_with_context)
+            # Don't keep failures around, so pressing the button again retries them
+            if has_failed_rows(results):
+                check_hosting_cached.clear(links_with_context)
             if input_mode == "md":
                 df_results = pd.DataFrame(results, columns=["Name", "Profile", "URL", "Host", "NS Provider"])
             else: